@@ -1,11 +1,18 @@
 """Device management for iOS devices"""
-import logging
-from typing import Optional, List
-from contextlib import contextmanager
+from __future__ import annotations
 
-from pymobiledevice3.lockdown import LockdownClient, create_using_usbmux
-from pymobiledevice3.services.afc import AfcService
-from pymobiledevice3.usbmux import list_devices
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Iterator, Optional, List
+from contextlib import ExitStack, contextmanager
+
+# pymobiledevice3 is imported on first device operation - it is heavy to load
+# and would otherwise dominate application startup (especially when frozen)
+if TYPE_CHECKING:
+    from pymobiledevice3.lockdown import LockdownClient
+    from pymobiledevice3.services.afc import AfcService
 
 from ..backend.models import DeviceInfo
 from ..core.config import AppConfig
@@ -13,15 +20,34 @@ from ..core.config import AppConfig
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def borrow_afc(afc_pool: queue.Queue) -> Iterator[AfcService]:
+    """Take an AFC service from a pool (see DeviceManager.afc_pool) and put it back on exit"""
+    afc = afc_pool.get()
+    try:
+        yield afc
+    finally:
+        afc_pool.put(afc)
+
+
 class DeviceManager:
     """Manages iOS device connections and operations"""
 
     def __init__(self):
         self._current_device: Optional[LockdownClient] = None
         self._device_info: Optional[DeviceInfo] = None
+        # AFC service shared across operations for the lifetime of the connection
+        self._afc_service: Optional[AfcService] = None
+        self._afc_lock = threading.RLock()
+        # Cached result of the last liveness check (see is_connected)
+        self._last_check_ts = 0.0
+        self._last_check_result = False
 
     def list_connected_devices(self) -> List[DeviceInfo]:
         """List all connected iOS devices"""
+        from pymobiledevice3.lockdown import create_using_usbmux
+        from pymobiledevice3.usbmux import list_devices
+
         devices = []
         try:
             device_list = list_devices()
@@ -48,7 +74,11 @@ class DeviceManager:
 
     def connect_device(self, udid: str) -> bool:
         """Connect to a specific device by UDID"""
+        from pymobiledevice3.lockdown import create_using_usbmux
+
         try:
+            self._close_afc_service()
+            self.invalidate_connection_check()
             self._current_device = create_using_usbmux(serial=udid)
 
             self._device_info = DeviceInfo(
@@ -71,22 +101,51 @@ class DeviceManager:
     def disconnect_device(self) -> None:
         """Disconnect from current device"""
         if self._current_device:
+            self._close_afc_service()
+            self.invalidate_connection_check()
             self._current_device = None
             self._device_info = None
             logger.info("Disconnected from device")
 
     def is_connected(self) -> bool:
-        """Check if device is currently connected"""
+        """
+        Check if device is currently connected
+
+        The result is cached for AppConfig.CONNECTION_CHECK_TTL seconds, and a
+        successful AFC operation counts as a positive check, so frequent callers
+        don't trigger a full usbmux enumeration each time.
+        """
         if not self._current_device or not self._device_info:
             return False
 
+        now = time.monotonic()
+        if now - self._last_check_ts < AppConfig.CONNECTION_CHECK_TTL:
+            return self._last_check_result
+
+        from pymobiledevice3.usbmux import list_devices
+
         try:
             # Verify device is still connected by checking device list
             devices = list_devices()
-            return any(d.serial == self._device_info.udid for d in devices)
+            connected = any(d.serial == self._device_info.udid for d in devices)
         except Exception:
+            self.invalidate_connection_check()
             return False
 
+        self._last_check_ts = now
+        self._last_check_result = connected
+        return connected
+
+    def _mark_connected(self) -> None:
+        """Record that the device just responded, refreshing the cached check"""
+        self._last_check_ts = time.monotonic()
+        self._last_check_result = True
+
+    def invalidate_connection_check(self) -> None:
+        """Force the next is_connected call to probe the device"""
+        self._last_check_ts = 0.0
+        self._last_check_result = False
+
     def get_current_device_info(self) -> Optional[DeviceInfo]:
         """Get information about currently connected device"""
         if self.is_connected():
@@ -95,10 +154,33 @@ class DeviceManager:
 
     @contextmanager
     def get_afc_service(self):
-        """Get AFC (Apple File Conduit) service for file operations"""
+        """
+        Get the shared AFC (Apple File Conduit) service for file operations
+
+        The service is opened once per device connection and reused by later
+        operations; it is re-opened only if the cached one stops responding.
+        Callers hold it exclusively until the context exits.
+        """
+        if not self._current_device:
+            raise RuntimeError("No device connected")
+
+        with self._afc_lock:
+            afc = self._get_shared_afc_service()
+            try:
+                yield afc
+            except Exception as e:
+                logger.error(f"AFC service error: {e}")
+                self.invalidate_connection_check()
+                raise
+
+    @contextmanager
+    def open_afc_service(self):
+        """Open a dedicated AFC service (e.g. for a worker thread), closed on exit"""
         if not self._current_device:
             raise RuntimeError("No device connected")
 
+        from pymobiledevice3.services.afc import AfcService
+
         afc = None
         try:
             afc = AfcService(lockdown=self._current_device)
@@ -113,6 +195,52 @@ class DeviceManager:
                 except Exception:
                     pass
 
+    @contextmanager
+    def afc_pool(self, size: int) -> Iterator[queue.Queue]:
+        """
+        Open a pool of up to `size` AFC services for worker threads
+
+        AfcService is not thread-safe, so each worker borrows its own connection
+        from the yielded queue (see borrow_afc). The pool starts with the shared
+        service; if the device refuses extra connections, it continues with fewer.
+        """
+        with ExitStack() as stack:
+            afc_pool: queue.Queue = queue.Queue()
+            afc_pool.put(stack.enter_context(self.get_afc_service()))
+            for _ in range(size - 1):
+                try:
+                    afc_pool.put(stack.enter_context(self.open_afc_service()))
+                except Exception as e:
+                    logger.warning(f"Could not open more AFC connections, using {afc_pool.qsize()}: {e}")
+                    break
+            yield afc_pool
+
+    def _get_shared_afc_service(self) -> AfcService:
+        """Return the cached AFC service, re-opening it if it no longer responds"""
+        if self._afc_service is not None:
+            try:
+                self._afc_service.stat('/')
+                self._mark_connected()
+                return self._afc_service
+            except Exception as e:
+                logger.info(f"Cached AFC service is stale, reopening: {e}")
+                self._close_afc_service()
+
+        from pymobiledevice3.services.afc import AfcService
+
+        self._afc_service = AfcService(lockdown=self._current_device)
+        self._mark_connected()
+        return self._afc_service
+
+    def _close_afc_service(self) -> None:
+        """Close the cached AFC service if one is open"""
+        afc, self._afc_service = self._afc_service, None
+        if afc:
+            try:
+                afc.close()
+            except Exception:
+                pass
+
     def verify_connection(self) -> tuple[bool, Optional[str]]:
         """Verify device connection and return status with message"""
         if not self._current_device:
@@ -1,4 +1,7 @@
 """Data models for photo management"""
+import math
+import time
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
@@ -14,51 +17,99 @@ class TransferStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Photo:
     """Represents a single photo on the device"""
     filename: str
     path: str
     size: int
-    created_date: datetime
-    modified_date: Optional[datetime] = None
+    created_date: float  # Seconds since the epoch
+    modified_date: Optional[float] = None  # Seconds since the epoch
 
     @property
     def size_mb(self) -> float:
         """Return size in megabytes"""
         return self.size / (1024 * 1024)
 
+    @property
+    def created_datetime(self) -> datetime:
+        """Return creation date as a local datetime (for display)"""
+        return datetime.fromtimestamp(self.created_date)
+
+    @property
+    def year_month(self) -> tuple[int, int]:
+        """Extract (year, month) from creation date with a single local time conversion"""
+        created = time.localtime(self.created_date)
+        return created.tm_year, created.tm_mon
+
     @property
     def year(self) -> int:
         """Extract year from creation date"""
-        if isinstance(self.created_date, datetime):
-            return self.created_date.year
-        # Fallback if created_date is somehow an int/float timestamp
-        if isinstance(self.created_date, (int, float)):
-            return datetime.fromtimestamp(self.created_date).year
-        raise TypeError(f"created_date has invalid type: {type(self.created_date)}")
+        return time.localtime(self.created_date).tm_year
 
     @property
     def month(self) -> int:
         """Extract month from creation date"""
-        if isinstance(self.created_date, datetime):
-            return self.created_date.month
-        # Fallback if created_date is somehow an int/float timestamp
-        if isinstance(self.created_date, (int, float)):
-            return datetime.fromtimestamp(self.created_date).month
-        raise TypeError(f"created_date has invalid type: {type(self.created_date)}")
-
-
-@dataclass
+        return time.localtime(self.created_date).tm_mon
+
+
+@dataclass(slots=True)
+class PhotoTable:
+    """Column-oriented storage for scanned media files (one row per file)"""
+    paths: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('q'))
+    created_dates: array = field(default_factory=lambda: array('d'))  # Seconds since the epoch
+    modified_dates: array = field(default_factory=lambda: array('d'))  # NaN when unknown
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, row: int) -> Photo:
+        """Build a Photo for a single row"""
+        path = self.paths[row]
+        modified_date = self.modified_dates[row]
+        return Photo(
+            filename=path.rsplit('/', 1)[-1],  # Device paths always use '/'
+            path=path,
+            size=self.sizes[row],
+            created_date=self.created_dates[row],
+            modified_date=None if math.isnan(modified_date) else modified_date
+        )
+
+    def append(self, path: str, size: int, created_date: float, modified_date: Optional[float]) -> None:
+        """Add a row"""
+        self.paths.append(path)
+        self.sizes.append(size)
+        self.created_dates.append(created_date)
+        self.modified_dates.append(math.nan if modified_date is None else modified_date)
+
+    def extend(self, other: "PhotoTable") -> None:
+        """Append all rows of another table"""
+        self.paths.extend(other.paths)
+        self.sizes.extend(other.sizes)
+        self.created_dates.extend(other.created_dates)
+        self.modified_dates.extend(other.modified_dates)
+
+
+@dataclass(slots=True)
 class MonthStats:
     """Statistics for photos in a specific month"""
     year: int
     month: int
     photo_count: int = 0
     total_size: int = 0
-    photos: List[Photo] = field(default_factory=list)
+    table: Optional[PhotoTable] = None
+    rows: array = field(default_factory=lambda: array('q'))  # Row indexes into table
     selected: bool = False
 
+    @property
+    def photos(self) -> List[Photo]:
+        """Build Photo objects for this month's rows"""
+        if self.table is None:
+            return []
+        table = self.table
+        return [table[row] for row in self.rows]
+
     @property
     def size_mb(self) -> float:
         """Return total size in megabytes"""
@@ -77,7 +128,7 @@ class MonthStats:
         return months[self.month - 1]
 
 
-@dataclass
+@dataclass(slots=True)
 class YearStats:
     """Statistics for photos in a specific year"""
     year: int
@@ -103,7 +154,7 @@ class YearStats:
         self.total_size += month_stats.total_size
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Information about connected iOS device"""
     udid: str
@@ -116,7 +167,7 @@ class DeviceInfo:
         return f"{self.name} (iOS {self.ios_version})"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferProgress:
     """Progress information for transfer operations"""
     total_files: int
@@ -127,6 +178,9 @@ class TransferProgress:
     current_file: Optional[str] = None
     status: TransferStatus = TransferStatus.PENDING
     error_message: Optional[str] = None
+    # Human-readable sizes, kept up to date by the transfer thread for display
+    transferred_size_str: str = "0 B"
+    total_size_str: str = "0 B"
 
     @property
     def progress_percent(self) -> float:
@@ -1,14 +1,18 @@
 """Photo analysis and organization"""
+from __future__ import annotations
+
 import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Callable, Optional
-from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Callable, Optional, Tuple
 
-from pymobiledevice3.services.afc import AfcService
+if TYPE_CHECKING:
+    from pymobiledevice3.services.afc import AfcService
 
-from ..backend.models import Photo, MonthStats, YearStats
-from ..backend.device_manager import DeviceManager
+from ..backend.models import PhotoTable, MonthStats, YearStats
+from ..backend.device_manager import DeviceManager, borrow_afc
 from ..core.config import AppConfig
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,7 @@ class PhotoAnalyzer:
             '/DCIM',  # Camera Roll
             '/Media/DCIM',  # Alternative path
         ]
+        self._exts = AppConfig.ALL_MEDIA_EXTENSIONS
 
     def analyze_photos(self,
                        progress_callback: Optional[Callable[[str, int, int], None]] = None
@@ -37,46 +42,47 @@ class PhotoAnalyzer:
             Dictionary mapping year to YearStats
         """
         year_stats: Dict[int, YearStats] = {}
-        photos_by_year_month: Dict[int, Dict[int, List[Photo]]] = defaultdict(lambda: defaultdict(list))
+        month_stats: Dict[Tuple[int, int], MonthStats] = {}
 
         try:
-            with self.device_manager.get_afc_service() as afc:
-                all_photos = self._find_all_photos(afc, progress_callback)
-
-                total_photos = len(all_photos)
-                logger.info(f"Found {total_photos} media files to analyze")
-
-                # Organize photos by year and month
-                for idx, photo in enumerate(all_photos):
-                    if progress_callback and idx % 10 == 0:
-                        progress_callback(
-                            f"Organizing photo {idx + 1} of {total_photos}",
-                            idx + 1,
-                            total_photos
-                        )
-
-                    year = photo.year
-                    month = photo.month
-                    photos_by_year_month[year][month].append(photo)
-
-                # Create statistics for each year and month
-                for year, months in photos_by_year_month.items():
-                    year_stat = YearStats(year=year)
-
-                    for month, photos in months.items():
-                        month_stat = MonthStats(
-                            year=year,
-                            month=month,
-                            photo_count=len(photos),
-                            total_size=sum(p.size for p in photos),
-                            photos=photos
-                        )
-                        year_stat.add_month(month_stat)
-
-                    year_stats[year] = year_stat
-
-                if progress_callback:
-                    progress_callback("Analysis complete", total_photos, total_photos)
+            # Only the scan needs the device - release the AFC services before bucketing
+            with self.device_manager.afc_pool(AppConfig.SCAN_WORKERS) as afc_pool:
+                table = self._find_all_photos(afc_pool, progress_callback)
+
+            total_photos = len(table)
+            logger.info(f"Found {total_photos} media files to analyze")
+
+            # Bucket rows by year and month, accumulating counts and sizes
+            # in the same pass instead of re-walking each bucket afterwards
+            sizes = table.sizes
+            localtime = time.localtime
+            for idx, created_date in enumerate(table.created_dates):
+                if progress_callback and idx % 10 == 0:
+                    progress_callback(
+                        f"Organizing photo {idx + 1} of {total_photos}",
+                        idx + 1,
+                        total_photos
+                    )
+
+                created = localtime(created_date)
+                key = (created.tm_year, created.tm_mon)
+                month_stat = month_stats.get(key)
+                if month_stat is None:
+                    month_stat = month_stats[key] = MonthStats(year=key[0], month=key[1], table=table)
+
+                month_stat.rows.append(idx)
+                month_stat.photo_count += 1
+                month_stat.total_size += sizes[idx]
+
+            # Create statistics for each year
+            for (year, _), month_stat in month_stats.items():
+                year_stat = year_stats.get(year)
+                if year_stat is None:
+                    year_stat = year_stats[year] = YearStats(year=year)
+                year_stat.add_month(month_stat)
+
+            if progress_callback:
+                progress_callback("Analysis complete", total_photos, total_photos)
 
         except Exception as e:
             logger.error(f"Error analyzing photos: {e}")
@@ -85,89 +91,135 @@ class PhotoAnalyzer:
         return year_stats
 
     def _find_all_photos(self,
-                         afc: AfcService,
+                         afc_pool: queue.Queue,
                          progress_callback: Optional[Callable[[str, int, int], None]] = None
-                         ) -> List[Photo]:
-        """Find all photos and videos on the device"""
-        all_photos = []
-        # Use a list to track count across recursive calls (mutable reference)
-        photo_counter = [0]
-
-        for base_path in self._photo_paths:
-            try:
-                if not self._path_exists(afc, base_path):
+                         ) -> PhotoTable:
+        """Find all photos and videos on the device using a pool of AFC connections"""
+        all_photos = PhotoTable()
+        root_entries: List[str] = []
+
+        with borrow_afc(afc_pool) as afc:
+            for base_path in self._photo_paths:
+                # Listing the root directly doubles as the existence check
+                try:
+                    items = afc.listdir(base_path)
+                except Exception:
+                    logger.debug(f"{base_path} not found on device")
                     continue
 
                 if progress_callback:
-                    progress_callback(f"Scanning {base_path}...", photo_counter[0], photo_counter[0])
+                    progress_callback(f"Scanning {base_path}...", 0, 0)
 
-                photos = self._scan_directory_recursive(afc, base_path, progress_callback, photo_counter)
-                all_photos.extend(photos)
+                root_entries.extend(self._filter_entries(base_path, items))
 
-            except Exception as e:
-                logger.warning(f"Could not scan {base_path}: {e}")
-                continue
+        def borrow(func: Callable, arg):
+            with borrow_afc(afc_pool) as worker_afc:
+                return func(worker_afc, arg)
 
-        return all_photos
+        with ThreadPoolExecutor(max_workers=AppConfig.SCAN_WORKERS) as executor:
+            pending = set()
+            listings = set()
 
-    def _scan_directory_recursive(self,
-                                   afc: AfcService,
-                                   path: str,
-                                   progress_callback: Optional[Callable[[str, int, int], None]] = None,
-                                   photo_counter: Optional[list] = None
-                                   ) -> List[Photo]:
-        """Recursively scan directory for photos"""
-        photos = []
-        if photo_counter is None:
-            photo_counter = [0]
+            def submit_listing(path: str) -> None:
+                future = executor.submit(borrow, self._list_directory, path)
+                listings.add(future)
+                pending.add(future)
 
-        try:
-            items = afc.listdir(path)
+            def submit_stats(entries: List[str]) -> None:
+                for i in range(0, len(entries), AppConfig.SCAN_STAT_BATCH):
+                    batch = entries[i:i + AppConfig.SCAN_STAT_BATCH]
+                    pending.add(executor.submit(borrow, self._stat_entries, batch))
 
-            for item in items:
-                if item in ('.', '..'):
-                    continue
+            submit_stats(root_entries)
 
-                item_path = f"{path}/{item}" if not path.endswith('/') else f"{path}{item}"
+            # Breadth-first walk. Directory entries are statted in batches spread
+            # over the whole pool, so one large folder (e.g. 100APPLE) keeps every
+            # connection busy instead of being walked by a single worker.
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-                try:
-                    info = afc.stat(item_path)
-
-                    # Check if it's a directory
-                    if info.get('st_ifmt') == 'S_IFDIR':
-                        # Recursively scan subdirectory
-                        photos.extend(self._scan_directory_recursive(afc, item_path, progress_callback, photo_counter))
-                    else:
-                        # Check if it's a photo or video
-                        if self._is_photo_file(item):
-                            photo = self._create_photo_from_stat(item_path, info)
-                            if photo:
-                                photos.append(photo)
-                                photo_counter[0] += 1
-
-                                if progress_callback and photo_counter[0] % 50 == 0:
-                                    progress_callback(
-                                        f"Found {photo_counter[0]} media files...",
-                                        photo_counter[0],
-                                        photo_counter[0]
-                                    )
-
-                except Exception as e:
-                    logger.debug(f"Error processing item {item_path}: {e}")
-                    continue
+                for future in done:
+                    if future in listings:
+                        listings.discard(future)
+                        submit_stats(future.result())
+                        continue
+
+                    subdirs, photos = future.result()
+                    all_photos.extend(photos)
+                    for subdir in subdirs:
+                        submit_listing(subdir)
+
+                    if progress_callback and photos:
+                        progress_callback(
+                            f"Found {len(all_photos)} media files...",
+                            len(all_photos),
+                            len(all_photos)
+                        )
 
+        return all_photos
+
+    def _list_directory(self, afc: AfcService, path: str) -> List[str]:
+        """List a directory and return the entry paths worth a stat call"""
+        try:
+            items = afc.listdir(path)
         except Exception as e:
             logger.warning(f"Error scanning directory {path}: {e}")
+            return []
 
-        return photos
+        return self._filter_entries(path, items)
+
+    def _filter_entries(self, path: str, items: List[str]) -> List[str]:
+        """Return the paths of listed entries worth a stat call"""
+        entries = []
+        exts = self._exts
+        prefix = path if path.endswith('/') else f"{path}/"
+        for item in items:
+            if item in ('.', '..'):
+                continue
+
+            dot = item.rfind('.')
+            if dot > 0 and item[dot:].lower() not in exts:
+                # Sidecar/metadata file (e.g. .AAE) - not worth a stat round-trip.
+                # DCIM folders (100APPLE, .MISC, ...) have no extension.
+                continue
+
+            entries.append(prefix + item)
+
+        return entries
+
+    def _stat_entries(self, afc: AfcService, paths: List[str]) -> Tuple[List[str], PhotoTable]:
+        """Stat directory entries and split them into subdirectories and media files"""
+        subdirs = []
+        photos = PhotoTable()
+
+        # Bind hot-loop lookups to locals
+        afc_stat = afc.stat
+        is_photo = self._is_photo_file
+        add_photo = self._add_photo_from_stat
+
+        for item_path in paths:
+            try:
+                info = afc_stat(item_path)
+
+                # Check if it's a directory
+                if info.get('st_ifmt') == 'S_IFDIR':
+                    subdirs.append(item_path)
+                elif is_photo(item_path):
+                    add_photo(photos, item_path, info)
+
+            except Exception as e:
+                logger.debug(f"Error processing item {item_path}: {e}")
+                continue
+
+        return subdirs, photos
 
     def _is_photo_file(self, filename: str) -> bool:
         """Check if file is a photo or video based on extension"""
-        ext = Path(filename).suffix.lower()
-        return ext in AppConfig.PHOTO_EXTENSIONS or ext in AppConfig.VIDEO_EXTENSIONS
+        dot = filename.rfind('.')
+        return dot > 0 and filename[dot:].lower() in self._exts
 
-    def _create_photo_from_stat(self, path: str, stat_info: dict) -> Optional[Photo]:
-        """Create Photo object from file stat information"""
+    def _add_photo_from_stat(self, table: PhotoTable, path: str, stat_info: dict) -> bool:
+        """Add a row to the photo table from file stat information"""
         try:
             # Get file size
             size = stat_info.get('st_size', 0)
@@ -177,44 +229,29 @@ class PhotoAnalyzer:
             if created_date is None:
                 # Skip files without creation date - we only want to group by actual creation date
                 logger.debug(f"Skipping {path}: no creation date available")
-                return None
+                return False
 
-            # Get modification time (stored but not used for grouping)
+            # Get modification time (not used for grouping, restored on the exported copy)
             modified_date = stat_info.get('st_mtime', None)
 
-            return Photo(
-                filename=Path(path).name,
-                path=path,
-                size=size,
-                created_date=created_date,
-                modified_date=modified_date
-            )
+            # pymobiledevice3 reports times as datetimes - keep raw epoch seconds instead
+            if isinstance(created_date, datetime):
+                created_date = created_date.timestamp()
+            if isinstance(modified_date, datetime):
+                modified_date = modified_date.timestamp()
 
-        except Exception as e:
-            logger.error(f"Error creating Photo object for {path}: {e}")
-            return None
-
-    def _path_exists(self, afc: AfcService, path: str) -> bool:
-        """Check if path exists on device"""
-        try:
-            afc.stat(path)
+            table.append(path, size, created_date, modified_date)
             return True
-        except Exception:
+
+        except Exception as e:
+            logger.error(f"Error reading stat information for {path}: {e}")
             return False
 
-    def get_selected_photos(self, year_stats: Dict[int, YearStats]) -> List[Photo]:
-        """Get all photos from selected years and months"""
-        selected_photos = []
-
-        for year_stat in year_stats.values():
-            if year_stat.selected:
-                # All months in this year are selected
-                for month_stat in year_stat.months.values():
-                    selected_photos.extend(month_stat.photos)
-            else:
-                # Only selected months
-                for month_stat in year_stat.months.values():
-                    if month_stat.selected:
-                        selected_photos.extend(month_stat.photos)
-
-        return selected_photos
+    def get_selected_months(self, year_stats: Dict[int, YearStats]) -> List[MonthStats]:
+        """Get all months that are selected directly or through their year"""
+        return [
+            month_stat
+            for year_stat in year_stats.values()
+            for month_stat in year_stat.months.values()
+            if year_stat.selected or month_stat.selected
+        ]
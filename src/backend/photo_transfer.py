@@ -1,17 +1,23 @@
 """Media transfer operations (photos and videos) with device disconnection handling"""
+from __future__ import annotations
+
 import logging
+import os
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Callable, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Callable, Optional, Tuple
 import time
 
-from pymobiledevice3.services.afc import AfcService
+if TYPE_CHECKING:
+    from pymobiledevice3.services.afc import AfcService
 
 from ..backend.models import Photo, TransferProgress, TransferStatus
-from ..backend.device_manager import DeviceManager
+from ..backend.device_manager import DeviceManager, borrow_afc
 from ..core.config import AppConfig
 from ..core.settings_manager import FolderOrganization
-from ..core.utils import create_export_path, sanitize_filename
+from ..core.utils import clear_path_cache, create_export_path, format_size, sanitize_filename
 
 logger = logging.getLogger(__name__)
 
@@ -26,23 +32,25 @@ class PhotoTransferManager:
         self._current_progress: Optional[TransferProgress] = None
 
     def start_transfer(self,
-                       photos: List[Photo],
+                       photos: Iterable[Photo],
                        export_path: Path,
                        delete_after_transfer: bool = True,
                        progress_callback: Optional[Callable[[TransferProgress], None]] = None,
                        folder_organization: FolderOrganization = FolderOrganization.YEAR_MONTH,
-                       batch_size: int = None
+                       batch_size: int = None,
+                       total_size: Optional[int] = None
                        ) -> None:
         """
         Start photo transfer in background thread
 
         Args:
-            photos: List of photos to transfer
+            photos: Photos to transfer. May be a lazy iterable, it is only consumed on the transfer thread
             export_path: Base export directory
             delete_after_transfer: Whether to delete photos from device after transfer
             progress_callback: Optional callback for progress updates
             folder_organization: How to organize folders (year/month or year only)
             batch_size: Number of files to transfer before checking connection (None = use default)
+            total_size: Precomputed total size of photos in bytes (None = sum photo sizes)
         """
         if self._transfer_thread and self._transfer_thread.is_alive():
             raise RuntimeError("Transfer already in progress")
@@ -50,7 +58,8 @@ class PhotoTransferManager:
         self._is_cancelled = False
         self._transfer_thread = threading.Thread(
             target=self._transfer_worker,
-            args=(photos, export_path, delete_after_transfer, progress_callback, folder_organization, batch_size),
+            args=(photos, export_path, delete_after_transfer, progress_callback, folder_organization, batch_size,
+                  total_size),
             daemon=True
         )
         self._transfer_thread.start()
@@ -69,15 +78,20 @@ class PhotoTransferManager:
         return self._current_progress
 
     def _transfer_worker(self,
-                         photos: List[Photo],
+                         photos: Iterable[Photo],
                          export_path: Path,
                          delete_after_transfer: bool,
                          progress_callback: Optional[Callable[[TransferProgress], None]],
                          folder_organization: FolderOrganization,
-                         batch_size: Optional[int]
+                         batch_size: Optional[int],
+                         total_size: Optional[int]
                          ) -> None:
         """Worker thread for photo transfer"""
-        total_size = sum(p.size for p in photos)
+        # Transfer folder by folder so the device's read-ahead stays effective.
+        # Sorting by full path keeps each directory's files contiguous.
+        photos = sorted(photos, key=lambda p: p.path)
+        if total_size is None:
+            total_size = sum(p.size for p in photos)
 
         self._current_progress = TransferProgress(
             total_files=len(photos),
@@ -85,7 +99,8 @@ class PhotoTransferManager:
             failed_files=0,
             total_size=total_size,
             transferred_size=0,
-            status=TransferStatus.IN_PROGRESS
+            status=TransferStatus.IN_PROGRESS,
+            total_size_str=format_size(total_size)
         )
 
         try:
@@ -122,51 +137,107 @@ class PhotoTransferManager:
                          folder_organization: FolderOrganization,
                          batch_size: Optional[int]
                          ) -> None:
-        """Transfer photos with batch processing and reconnection handling"""
+        """Transfer photos over a pool of AFC connections with reconnection handling"""
         batch_count = 0
         failed_photos = []
         # Use provided batch size or fall back to default
         effective_batch_size = batch_size if batch_size is not None else AppConfig.BATCH_SIZE
 
-        with self.device_manager.get_afc_service() as afc:
-            for idx, photo in enumerate(photos):
+        # Create each destination directory once up front instead of once per photo.
+        # Folders may have been removed since the last transfer, so check them again.
+        clear_path_cache()
+        year_only = (folder_organization == FolderOrganization.YEAR_ONLY)
+        export_dirs: Dict[Tuple[int, ...], Path] = {}
+        photo_dirs: List[Path] = []
+        for photo in photos:
+            year, month = photo.year_month
+            key = (year,) if year_only else (year, month)
+            export_dir = export_dirs.get(key)
+            if export_dir is None:
+                export_dir = export_dirs[key] = create_export_path(export_path, year, month, year_only=year_only)
+            photo_dirs.append(export_dir)
+
+        # The deleter borrows from the same pool, so it gets its own connection
+        # whenever the device allows one more
+        pool_size = AppConfig.TRANSFER_WORKERS + (1 if delete_after_transfer else 0)
+        with self.device_manager.afc_pool(pool_size) as afc_pool:
+            def transfer(photo: Photo, export_dir: Path) -> Optional[bool]:
                 if self._is_cancelled:
-                    break
-
-                # Check connection periodically
-                if batch_count >= effective_batch_size:
-                    if not self._verify_and_reconnect():
-                        raise RuntimeError("Device disconnected and could not reconnect")
-                    batch_count = 0
-
-                # Update current file
-                self._current_progress.current_file = photo.filename
-
-                try:
-                    # Transfer photo
-                    success = self._transfer_single_photo(afc, photo, export_path, folder_organization)
-
-                    if success:
-                        self._current_progress.completed_files += 1
-                        self._current_progress.transferred_size += photo.size
-
-                        # Delete from device if requested
-                        if delete_after_transfer:
-                            self._delete_photo(afc, photo)
-                    else:
-                        self._current_progress.failed_files += 1
-                        failed_photos.append(photo)
-
-                except Exception as e:
-                    logger.error(f"Error transferring {photo.filename}: {e}")
-                    self._current_progress.failed_files += 1
-                    failed_photos.append(photo)
-
-                batch_count += 1
-
-                # Send progress update
-                if progress_callback:
-                    progress_callback(self._current_progress)
+                    return None
+                with borrow_afc(afc_pool) as afc:
+                    return self._transfer_single_photo(afc, photo, export_dir)
+
+            # Deletes run on a single thread so they hit the device in completion order
+            delete_queue: Optional[queue.Queue] = None
+            deleter: Optional[threading.Thread] = None
+            if delete_after_transfer:
+                delete_queue = queue.Queue()
+                deleter = threading.Thread(
+                    target=self._delete_worker,
+                    args=(afc_pool, delete_queue),
+                    daemon=True
+                )
+                deleter.start()
+
+            try:
+                with ThreadPoolExecutor(max_workers=AppConfig.TRANSFER_WORKERS) as executor:
+                    futures = {
+                        executor.submit(transfer, photo, export_dir): photo
+                        for photo, export_dir in zip(photos, photo_dirs)
+                    }
+
+                    try:
+                        for future in as_completed(futures):
+                            photo = futures[future]
+
+                            try:
+                                success = future.result()
+                            except Exception as e:
+                                logger.error(f"Error transferring {photo.filename}: {e}")
+                                success = False
+
+                            if success is None:
+                                # Skipped after cancellation
+                                continue
+
+                            # Update current file
+                            self._current_progress.current_file = photo.filename
+
+                            if success:
+                                self._current_progress.completed_files += 1
+                                self._current_progress.transferred_size += photo.size
+                                self._current_progress.transferred_size_str = format_size(
+                                    self._current_progress.transferred_size
+                                )
+
+                                # Delete from device if requested
+                                if delete_queue is not None:
+                                    delete_queue.put(photo)
+                            else:
+                                self._current_progress.failed_files += 1
+                                failed_photos.append(photo)
+
+                            batch_count += 1
+
+                            # Check connection periodically
+                            if batch_count >= effective_batch_size:
+                                with borrow_afc(afc_pool) as afc:
+                                    connected = self._verify_and_reconnect(afc)
+                                if not connected:
+                                    raise RuntimeError("Device disconnected and could not reconnect")
+                                batch_count = 0
+
+                            # Send progress update
+                            if progress_callback:
+                                progress_callback(self._current_progress)
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+            finally:
+                if deleter is not None:
+                    delete_queue.put(None)
+                    deleter.join()
 
         # Log failed photos
         if failed_photos:
@@ -174,28 +245,47 @@ class PhotoTransferManager:
             for photo in failed_photos:
                 logger.warning(f"Failed: {photo.filename}")
 
+    def _delete_worker(self, afc_pool: queue.Queue, delete_queue: queue.Queue) -> None:
+        """Delete transferred photos from the device until a None sentinel arrives"""
+        while True:
+            photo = delete_queue.get()
+            if photo is None:
+                break
+            with borrow_afc(afc_pool) as afc:
+                self._delete_photo(afc, photo)
+
     def _transfer_single_photo(self,
                                afc: AfcService,
                                photo: Photo,
-                               base_export_path: Path,
-                               folder_organization: FolderOrganization = FolderOrganization.YEAR_MONTH
+                               export_dir: Path
                                ) -> bool:
-        """Transfer a single photo from device to local storage"""
+        """Transfer a single photo from device into an existing export directory"""
         try:
-            # Create directory structure based on organization preference
-            year_only = (folder_organization == FolderOrganization.YEAR_ONLY)
-            export_dir = create_export_path(base_export_path, photo.year, photo.month, year_only=year_only)
-
             # Sanitize filename
             safe_filename = sanitize_filename(photo.filename)
             target_path = export_dir / safe_filename
 
-            # Use pull method to download file from device (will override if file exists)
-            afc.pull(
-                relative_src=photo.path,
-                dst=str(target_path),
-                progress_bar=False
-            )
+            # Stream the file off the device in large chunks (will override if file exists).
+            # afc.pull() adds several stat round-trips per file on top of the reads.
+            handle = afc.fopen(photo.path, 'r')
+            try:
+                with open(target_path, 'wb') as f:
+                    while True:
+                        chunk = afc.fread(handle, AppConfig.BUFFER_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+
+                    if hasattr(os, 'posix_fadvise'):
+                        # Exported files are not read back, keep them out of the page cache
+                        f.flush()
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                afc.fclose(handle)
+
+            # Keep the device modification time on the exported copy
+            if photo.modified_date is not None:
+                os.utime(target_path, (photo.modified_date, photo.modified_date))
 
             logger.debug(f"Transferred: {photo.filename} -> {target_path}")
             return True
@@ -214,8 +304,18 @@ class PhotoTransferManager:
             logger.error(f"Failed to delete {photo.filename}: {e}")
             return False
 
-    def _verify_and_reconnect(self) -> bool:
+    def _verify_and_reconnect(self, afc: Optional[AfcService] = None) -> bool:
         """Verify device connection and attempt reconnection if needed"""
+        # A single round-trip on a transfer connection is far cheaper than a
+        # usbmux enumeration and exercises the socket the transfer actually uses
+        if afc is not None:
+            try:
+                afc.stat('/')
+                return True
+            except Exception as e:
+                logger.warning(f"AFC connection probe failed: {e}")
+                self.device_manager.invalidate_connection_check()
+
         is_connected, error_msg = self.device_manager.verify_connection()
 
         if is_connected:
@@ -228,6 +328,8 @@ class PhotoTransferManager:
             logger.info(f"Reconnection attempt {attempt + 1}/{AppConfig.RECONNECT_ATTEMPTS}")
             time.sleep(AppConfig.RECONNECT_DELAY)
 
+            # Probe the device again rather than reading the cached failure
+            self.device_manager.invalidate_connection_check()
             if self.device_manager.is_connected():
                 logger.info("Reconnection successful")
                 return True
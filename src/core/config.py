@@ -1,6 +1,5 @@
 """Application configuration and constants"""
 from pathlib import Path
-from typing import List
 
 
 class AppConfig:
@@ -20,23 +19,33 @@ class AppConfig:
     THEME = "dark-blue"
     COLOR_THEME = "blue"
 
-    # Photo file extensions
-    PHOTO_EXTENSIONS: List[str] = [
+    # Photo file extensions (lowercase)
+    PHOTO_EXTENSIONS: frozenset[str] = frozenset({
         '.jpg', '.jpeg', '.png', '.heic', '.heif',
         '.gif', '.tiff', '.bmp', '.raw', '.cr2', '.nef', '.dng'
-    ]
+    })
 
-    # Video file extensions
-    VIDEO_EXTENSIONS: List[str] = [
+    # Video file extensions (lowercase)
+    VIDEO_EXTENSIONS: frozenset[str] = frozenset({
         '.mp4', '.mov', '.avi', '.mkv', '.m4v', '.3gp', '.wmv', '.flv'
-    ]
+    })
+
+    # Any media file we back up
+    ALL_MEDIA_EXTENSIONS: frozenset[str] = PHOTO_EXTENSIONS | VIDEO_EXTENSIONS
 
     # Transfer settings
     BATCH_SIZE = 10  # Number of files to transfer before checking device connection
-    BUFFER_SIZE = 8192  # Buffer size for file operations
+    BUFFER_SIZE = 1024 * 1024  # Chunk size when streaming files off the device
+    TRANSFER_WORKERS = 4  # Parallel AFC connections used when transferring files
+
+    # Scan settings
+    SCAN_WORKERS = 8  # Parallel AFC connections used when scanning the device
+    SCAN_STAT_BATCH = 64  # Directory entries statted per scan job
 
     # Progress update frequency
     PROGRESS_UPDATE_INTERVAL = 0.5  # seconds
+    PROGRESS_REDRAW_MS = 40  # Minimum time between progress redraws in the UI
+    TOAST_DURATION_MS = 4000  # How long completion notices stay visible
 
     # Default export folder
     DEFAULT_EXPORT_FOLDER = str(Path.home() / "iPhone_Photos")
@@ -45,3 +54,4 @@ class AppConfig:
     CONNECTION_TIMEOUT = 10  # seconds
     RECONNECT_ATTEMPTS = 3
     RECONNECT_DELAY = 2  # seconds
+    CONNECTION_CHECK_TTL = 2.0  # seconds a connection check result is reused
@@ -1,6 +1,10 @@
 """Settings and statistics manager with persistent storage"""
-import json
+import atexit
 import logging
+import os
+import sys
+import threading
+from functools import cache
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -9,6 +13,9 @@ from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Settings changes within this window are written to disk together
+SETTINGS_SAVE_DELAY = 0.5  # seconds
+
 
 class FolderOrganization(Enum):
     """How to organize exported photos into folders"""
@@ -46,11 +53,27 @@ class UserSettings(BaseModel):
     delete_after_export: bool = True
 
 
+@cache
+def _get_settings_directory() -> Path:
+    """Get platform-specific settings directory"""
+    if sys.platform.startswith("win"):
+        # Use AppData\Local on Windows
+        base = Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        # Use Application Support on macOS
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        # Use .config on Linux/Unix
+        base = Path.home() / ".config"
+
+    return base / "iPhonePhotoBackup"
+
+
 class SettingsManager:
     """Manages application settings and statistics with persistent storage"""
 
     def __init__(self):
-        self._settings_dir = self._get_settings_directory()
+        self._settings_dir = _get_settings_directory()
         self._settings_file = self._settings_dir / "settings.json"
         self._stats_file = self._settings_dir / "stats.json"
 
@@ -61,24 +84,14 @@ class SettingsManager:
         self.settings = self._load_settings()
         self.stats = self._load_stats()
 
-    @staticmethod
-    def _get_settings_directory() -> Path:
-        """Get platform-specific settings directory"""
-        import platform
-
-        system = platform.system()
-
-        if system == "Windows":
-            # Use AppData\Local on Windows
-            base = Path.home() / "AppData" / "Local"
-        elif system == "Darwin":
-            # Use Application Support on macOS
-            base = Path.home() / "Library" / "Application Support"
-        else:
-            # Use .config on Linux/Unix
-            base = Path.home() / ".config"
-
-        return base / "iPhonePhotoBackup"
+        # Debounced settings saves (see _schedule_save)
+        self._save_lock = threading.Lock()
+        # Held for the whole settings write, so the debounce timer and flush()
+        # never write the temporary file at the same time
+        self._write_lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
 
     def _load_settings(self) -> UserSettings:
         """Load settings from file"""
@@ -87,12 +100,12 @@ class SettingsManager:
             return UserSettings()
 
         try:
-            with open(self._settings_file, 'r') as f:
-                data = json.load(f)
+            # pydantic parses the raw bytes directly, without an intermediate dict
+            settings = UserSettings.model_validate_json(self._settings_file.read_bytes())
             logger.info("Settings loaded successfully")
-            return UserSettings(**data)
+            return settings
         except Exception as e:
-            logger.error(f"Failed to load settings: {e}")
+            logger.error("Failed to load settings: %s", e)
             return UserSettings()
 
     def _load_stats(self) -> ExportStats:
@@ -102,34 +115,64 @@ class SettingsManager:
             return ExportStats()
 
         try:
-            with open(self._stats_file, 'r') as f:
-                data = json.load(f)
+            stats = ExportStats.model_validate_json(self._stats_file.read_bytes())
             logger.info("Stats loaded successfully")
-            return ExportStats(**data)
+            return stats
         except Exception as e:
-            logger.error(f"Failed to load stats: {e}")
+            logger.error("Failed to load stats: %s", e)
             return ExportStats()
 
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        """Write a file via a temporary file and rename, so a crash never leaves it half-written"""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
     def save_settings(self) -> bool:
         """Save current settings to file"""
-        try:
-            with open(self._settings_file, 'w') as f:
-                json.dump(self.settings.model_dump(), f, indent=2)
-            logger.info("Settings saved successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
-            return False
+        with self._write_lock:
+            with self._save_lock:
+                self._dirty = False
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+
+            try:
+                self._write_atomic(self._settings_file, self.settings.model_dump_json(indent=2))
+                logger.info("Settings saved successfully")
+                return True
+            except Exception as e:
+                logger.error("Failed to save settings: %s", e)
+                return False
+
+    def flush(self) -> None:
+        """Write pending settings changes to disk now"""
+        with self._write_lock:
+            if self._dirty:
+                self.save_settings()
+
+    def _schedule_save(self) -> None:
+        """Mark settings as changed and save them once changes stop arriving"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SETTINGS_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def save_stats(self) -> bool:
         """Save current statistics to file"""
         try:
-            with open(self._stats_file, 'w') as f:
-                json.dump(self.stats.model_dump(), f, indent=2)
+            self._write_atomic(self._stats_file, self.stats.model_dump_json(indent=2))
             logger.info("Stats saved successfully")
             return True
         except Exception as e:
-            logger.error(f"Failed to save stats: {e}")
+            logger.error("Failed to save stats: %s", e)
             return False
 
     def update_export_stats(self, files_exported: int, size_exported: int) -> None:
@@ -139,7 +182,7 @@ class SettingsManager:
         self.stats.last_export_date = datetime.now().isoformat()
         self.stats.total_exports += 1
         self.save_stats()
-        logger.info(f"Stats updated: +{files_exported} files, +{size_exported / (1024*1024):.2f} MB")
+        logger.info("Stats updated: +%d files, +%.2f MB", files_exported, size_exported / (1024*1024))
 
     def get_folder_organization(self) -> FolderOrganization:
         """Get folder organization preference as enum"""
@@ -151,7 +194,7 @@ class SettingsManager:
     def set_folder_organization(self, org: FolderOrganization) -> None:
         """Set folder organization preference"""
         self.settings.folder_organization = org.value
-        self.save_settings()
+        self._schedule_save()
 
     def get_batch_size(self) -> int:
         """Get batch size preference"""
@@ -164,7 +207,7 @@ class SettingsManager:
     def set_export_path(self, path: str) -> None:
         """Set and save export path"""
         self.settings.export_path = path
-        self.save_settings()
+        self._schedule_save()
 
     def get_delete_after_export(self) -> bool:
         """Get delete after export preference"""
@@ -173,4 +216,4 @@ class SettingsManager:
     def set_delete_after_export(self, delete: bool) -> None:
         """Set delete after export preference"""
         self.settings.delete_after_export = delete
-        self.save_settings()
+        self._schedule_save()
@@ -1,32 +1,63 @@
 """Utility functions for the application"""
+import atexit
+import os
+import queue
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 import logging
+import logging.handlers
+
+# Background thread writing queued log records to the real handlers
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(log_level: str = "INFO") -> None:
-    """Configure application logging"""
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('iphone_backup.log')
-        ]
-    )
+    """
+    Configure application logging
+
+    Log calls only enqueue the record; console and file output happen on a
+    background listener thread so logging never blocks the caller on I/O.
+    """
+    global _log_listener
+
+    root = logging.getLogger()
+    if _log_listener is not None or root.handlers:
+        # Already configured
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.StreamHandler(),
+        logging.FileHandler('iphone_backup.log', delay=True)  # Opened on first record
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(getattr(logging, log_level))
 
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    # Drain the queue before the interpreter exits
+    atexit.register(_log_listener.stop)
 
+
+# (unit, power-of-two shift) for each size unit
+_SIZE_UNITS = (('B', 0), ('KB', 10), ('MB', 20), ('GB', 30))
+
+
+@lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format"""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+
+    # Every 10 bits is one unit step, so the bit length picks the unit directly
+    unit, shift = _SIZE_UNITS[min(3, (size_bytes.bit_length() - 1) // 10)]
+    return f"{size_bytes / (1 << shift):.2f} {unit}"
 
 
 def format_duration(seconds: float) -> str:
@@ -43,12 +74,24 @@ def format_duration(seconds: float) -> str:
         return f"{hours}h {minutes}m"
 
 
+# Maps every character that is invalid in a filename to '_'
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+@lru_cache(maxsize=65536)
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename to remove invalid characters"""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_SANITIZE_TABLE)
+
+
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+# Export directories already created by create_export_path
+_CREATED_PATHS: set[Path] = set()
+
+# Highest counter handed out by get_unique_filepath for each original path
+_UNIQUE_COUNTERS: dict[Path, int] = {}
 
 
 def create_export_path(base_path: Path, year: int, month: int, year_only: bool = False) -> Path:
@@ -67,29 +110,54 @@ def create_export_path(base_path: Path, year: int, month: int, year_only: bool =
     if year_only:
         export_path = base_path / str(year)
     else:
-        month_names = ["January", "February", "March", "April", "May", "June",
-                       "July", "August", "September", "October", "November", "December"]
-        export_path = base_path / str(year) / f"{month:02d}_{month_names[month - 1]}"
+        export_path = base_path / str(year) / f"{month:02d}_{_MONTH_NAMES[month - 1]}"
 
-    export_path.mkdir(parents=True, exist_ok=True)
+    if export_path not in _CREATED_PATHS:
+        export_path.mkdir(parents=True, exist_ok=True)
+        _CREATED_PATHS.add(export_path)
     return export_path
 
 
+def clear_path_cache() -> None:
+    """Forget cached export directories and unique filename counters, so they are checked again"""
+    _CREATED_PATHS.clear()
+    _UNIQUE_COUNTERS.clear()
+
+
 def get_unique_filepath(filepath: Path) -> Path:
     """Get unique filepath by appending number if file exists"""
     if not filepath.exists():
         return filepath
 
-    counter = 1
     stem = filepath.stem
     suffix = filepath.suffix
     parent = filepath.parent
 
-    while True:
-        new_filepath = parent / f"{stem}_{counter}{suffix}"
-        if not new_filepath.exists():
-            return new_filepath
-        counter += 1
+    def numbered(counter: int) -> Path:
+        return parent / f"{stem}_{counter}{suffix}"
+
+    # Start from the highest counter handed out for this name, if any.
+    # 'taken' is always a counter known to exist (0 being the original name).
+    taken = _UNIQUE_COUNTERS.get(filepath, 0)
+
+    # Exponential search for a free counter, then binary search back down to
+    # the first free one, so n existing copies cost O(log n) exists() calls
+    step = 1
+    free = taken + step
+    while numbered(free).exists():
+        taken = free
+        step *= 2
+        free = taken + step
+
+    while free - taken > 1:
+        mid = (taken + free) // 2
+        if numbered(mid).exists():
+            taken = mid
+        else:
+            free = mid
+
+    _UNIQUE_COUNTERS[filepath] = free
+    return numbered(free)
 
 
 def validate_export_path(path: str) -> tuple[bool, Optional[str]]:
@@ -103,6 +171,11 @@ def validate_export_path(path: str) -> tuple[bool, Optional[str]]:
         if not export_path.is_dir():
             return False, "Path is not a directory"
 
+        # access() answers from permission bits without touching the disk. Windows
+        # only reports the read-only attribute there (not ACLs), so probe instead.
+        if os.name == 'posix' and os.access(export_path, os.W_OK):
+            return True, None
+
         # Test write permission
         test_file = export_path / ".test_write"
         try:
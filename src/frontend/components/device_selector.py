@@ -1,8 +1,9 @@
 """Device selection component"""
 import customtkinter as ctk
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional
 
 from ...backend.models import DeviceInfo
+from ..fonts import get_font
 
 
 class DeviceSelector(ctk.CTkFrame):
@@ -17,6 +18,7 @@ class DeviceSelector(ctk.CTkFrame):
         self.on_analyze_clicked = on_analyze_clicked
         self.on_refresh_clicked = on_refresh_clicked
         self._current_devices: List[DeviceInfo] = []
+        self._name_to_device: Dict[str, DeviceInfo] = {}  # Maps combo box entry to device
 
         self._setup_ui()
 
@@ -26,7 +28,7 @@ class DeviceSelector(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="Select Device",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         title.pack(pady=(10, 5), padx=10, anchor="w")
 
@@ -61,7 +63,7 @@ class DeviceSelector(ctk.CTkFrame):
             command=self._on_analyze_clicked,
             width=190,
             height=35,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             fg_color=["#3B8ED0", "#1F6AA5"],
             hover_color=["#36719F", "#144870"],
             state="disabled"
@@ -72,7 +74,7 @@ class DeviceSelector(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color="gray"
         )
         self.status_label.pack(pady=(5, 10), padx=10)
@@ -80,6 +82,10 @@ class DeviceSelector(ctk.CTkFrame):
     def update_devices(self, devices: List[DeviceInfo]):
         """Update the list of available devices"""
         self._current_devices = devices
+        self._name_to_device = {}
+        for device in devices:
+            # Identically named devices resolve to the first one listed
+            self._name_to_device.setdefault(str(device), device)
 
         if devices:
             device_names = [str(device) for device in devices]
@@ -103,14 +109,7 @@ class DeviceSelector(ctk.CTkFrame):
 
     def get_selected_device(self) -> Optional[DeviceInfo]:
         """Get currently selected device"""
-        if not self._current_devices:
-            return None
-
-        current_index = self.device_combo.cget("values").index(self.device_combo.get())
-        if 0 <= current_index < len(self._current_devices):
-            return self._current_devices[current_index]
-
-        return None
+        return self._name_to_device.get(self.device_combo.get())
 
     def _on_device_changed(self, choice):
         """Handle device selection change"""
@@ -1,11 +1,20 @@
 """Tree view component for photo selection"""
+import itertools
 import customtkinter as ctk
-from typing import Dict, Optional, Callable
-import tkinter as tk
+from typing import Dict, Optional, Callable, Tuple
 from tkinter import ttk
 
 from ...backend.models import YearStats, MonthStats
 from ...core.utils import format_size
+from ..fonts import get_font
+
+# Braille spinner characters for smooth animation
+_SPINNER_CHARS = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+SPINNER_INTERVAL_MS = 125
+
+# Node tags, shared by every inserted row
+_YEAR_TAGS = ("year",)
+_MONTH_TAGS = ("month",)
 
 
 class PhotoTreeView(ctk.CTkFrame):
@@ -17,8 +26,13 @@ class PhotoTreeView(ctk.CTkFrame):
         self.on_selection_changed = on_selection_changed
         self._year_stats: Dict[int, YearStats] = {}
         self._tree_items: Dict[str, str] = {}  # Maps year/month to tree item ID
+        self._item_to_key: Dict[str, Tuple[int, Optional[int]]] = {}  # Maps tree item ID to (year, month)
+        # Running totals of the current selection, updated by delta on each toggle
+        self._selected_count = 0
+        self._selected_size = 0
         self._animation_running = False
-        self._spinner_index = 0
+        self._spinner_chars = itertools.cycle(_SPINNER_CHARS)
+        next(self._spinner_chars)  # The first frame is the label's initial text
 
         self._setup_ui()
 
@@ -28,7 +42,7 @@ class PhotoTreeView(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="Select Photos to Export",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         title.pack(pady=(10, 5), padx=10, anchor="w")
 
@@ -38,7 +52,7 @@ class PhotoTreeView(ctk.CTkFrame):
         self.loading_label = ctk.CTkLabel(
             self.loading_frame,
             text="⠋ Analyzing media...",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color="gray"
         )
         self.loading_label.pack(pady=100)
@@ -95,7 +109,7 @@ class PhotoTreeView(ctk.CTkFrame):
         self.summary_label = ctk.CTkLabel(
             self,
             text="No photos loaded",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color="gray"
         )
         self.summary_label.pack(pady=5, padx=10, anchor="w")
@@ -104,16 +118,20 @@ class PhotoTreeView(ctk.CTkFrame):
         """Load photo statistics into tree view"""
         self._year_stats = year_stats
         self._tree_items.clear()
+        self._item_to_key.clear()
 
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in one Tcl call. Tk only redraws once the event
+        # loop is idle, so the inserts below are displayed together anyway.
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
         # Add years in descending order
         for year in sorted(year_stats.keys(), reverse=True):
             year_stat = year_stats[year]
             self._add_year_node(year_stat)
 
+        self._recount_selection()
         self._update_summary()
 
     def _add_year_node(self, year_stat: YearStats):
@@ -126,10 +144,11 @@ class PhotoTreeView(ctk.CTkFrame):
             "end",
             text=year_text,
             values=(year_stat.photo_count, format_size(year_stat.total_size)),
-            tags=("year",)
+            tags=_YEAR_TAGS
         )
 
         self._tree_items[f"year_{year_stat.year}"] = year_item
+        self._item_to_key[year_item] = (year_stat.year, None)
 
         # Add month nodes
         for month in sorted(year_stat.months.keys()):
@@ -146,10 +165,11 @@ class PhotoTreeView(ctk.CTkFrame):
             "end",
             text=month_text,
             values=(month_stat.photo_count, format_size(month_stat.total_size)),
-            tags=("month",)
+            tags=_MONTH_TAGS
         )
 
         self._tree_items[f"month_{year}_{month_stat.month}"] = month_item
+        self._item_to_key[month_item] = (year, month_stat.month)
 
     def _on_tree_click(self, event):
         """Handle tree item click"""
@@ -171,15 +191,12 @@ class PhotoTreeView(ctk.CTkFrame):
     def _toggle_year(self, item: str):
         """Toggle year selection"""
         # Find the year
-        year = None
-        for key, value in self._tree_items.items():
-            if value == item and key.startswith("year_"):
-                year = int(key.split("_")[1])
-                break
-
-        if year is None:
+        key = self._item_to_key.get(item)
+        if key is None or key[1] is not None:
             return
 
+        year = key[0]
+
         year_stat = self._year_stats[year]
         year_stat.selected = not year_stat.selected
 
@@ -189,6 +206,8 @@ class PhotoTreeView(ctk.CTkFrame):
 
         # Update all months
         for month_stat in year_stat.months.values():
+            if month_stat.selected != year_stat.selected:
+                self._add_to_selection(month_stat, year_stat.selected)
             month_stat.selected = year_stat.selected
             month_item = self._tree_items.get(f"month_{year}_{month_stat.month}")
             if month_item:
@@ -203,21 +222,16 @@ class PhotoTreeView(ctk.CTkFrame):
     def _toggle_month(self, item: str):
         """Toggle month selection"""
         # Find the month
-        year = None
-        month = None
-        for key, value in self._tree_items.items():
-            if value == item and key.startswith("month_"):
-                parts = key.split("_")
-                year = int(parts[1])
-                month = int(parts[2])
-                break
-
-        if year is None or month is None:
+        key = self._item_to_key.get(item)
+        if key is None or key[1] is None:
             return
 
+        year, month = key
+
         year_stat = self._year_stats[year]
         month_stat = year_stat.months[month]
         month_stat.selected = not month_stat.selected
+        self._add_to_selection(month_stat, month_stat.selected)
 
         # Update checkbox
         checkbox = "☑" if month_stat.selected else "☐"
@@ -236,20 +250,26 @@ class PhotoTreeView(ctk.CTkFrame):
         if self.on_selection_changed:
             self.on_selection_changed()
 
-    def _update_summary(self):
-        """Update summary label with selection statistics"""
-        total_selected = 0
-        total_size = 0
+    def _add_to_selection(self, month_stat: MonthStats, selected: bool):
+        """Apply a month's selection change to the running totals"""
+        sign = 1 if selected else -1
+        self._selected_count += sign * month_stat.photo_count
+        self._selected_size += sign * month_stat.total_size
 
+    def _recount_selection(self):
+        """Recompute the running selection totals from scratch"""
+        self._selected_count = 0
+        self._selected_size = 0
         for year_stat in self._year_stats.values():
             for month_stat in year_stat.months.values():
                 if month_stat.selected:
-                    total_selected += month_stat.photo_count
-                    total_size += month_stat.total_size
+                    self._add_to_selection(month_stat, True)
 
-        if total_selected > 0:
+    def _update_summary(self):
+        """Update summary label with selection statistics"""
+        if self._selected_count > 0:
             self.summary_label.configure(
-                text=f"Selected: {total_selected} photos ({format_size(total_size)})",
+                text=f"Selected: {self._selected_count} photos ({format_size(self._selected_size)})",
                 text_color="green"
             )
         else:
@@ -260,12 +280,7 @@ class PhotoTreeView(ctk.CTkFrame):
 
     def get_selected_count(self) -> int:
         """Get count of selected photos"""
-        total = 0
-        for year_stat in self._year_stats.values():
-            for month_stat in year_stat.months.values():
-                if month_stat.selected:
-                    total += month_stat.photo_count
-        return total
+        return self._selected_count
 
     def set_enabled(self, enabled: bool):
         """Enable or disable the tree view"""
@@ -290,13 +305,13 @@ class PhotoTreeView(ctk.CTkFrame):
         if not self._animation_running:
             return
 
-        # Braille spinner characters for smooth animation
-        spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        self._spinner_index = (self._spinner_index + 1) % len(spinner_chars)
+        spinner_char = next(self._spinner_chars)
 
-        self.loading_label.configure(
-            text=f"{spinner_chars[self._spinner_index]} Analyzing media..."
-        )
+        # Only redraw while the loading frame is actually on screen
+        if self.loading_frame.winfo_ismapped():
+            self.loading_label.configure(
+                text=f"{spinner_char} Analyzing media..."
+            )
 
         # Schedule next animation frame
-        self.after(100, self._animate_spinner)
+        self.after(SPINNER_INTERVAL_MS, self._animate_spinner)
@@ -1,17 +1,42 @@
 """Progress display panel for operations"""
 import customtkinter as ctk
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from ...backend.models import TransferProgress, TransferStatus
-from ...core.utils import format_size
+from ..fonts import get_font
 
 
 class ProgressPanel(ctk.CTkFrame):
     """Panel for displaying operation progress"""
 
+    # Display text and color for each transfer status
+    _STATUS_TEXT = {
+        TransferStatus.PENDING: "Pending",
+        TransferStatus.IN_PROGRESS: "Transferring photos...",
+        TransferStatus.COMPLETED: "Transfer completed",
+        TransferStatus.FAILED: "Transfer failed",
+        TransferStatus.CANCELLED: "Transfer cancelled"
+    }
+    _STATUS_COLOR = {
+        TransferStatus.PENDING: "gray",
+        TransferStatus.IN_PROGRESS: "blue",
+        TransferStatus.COMPLETED: "green",
+        TransferStatus.FAILED: "red",
+        TransferStatus.CANCELLED: "orange"
+    }
+
     def __init__(self, parent):
         super().__init__(parent)
 
+        # Last rendered (text, color) per label and progress bar value, so
+        # repeated progress events skip unchanged widgets
+        self._label_state: Dict[ctk.CTkLabel, Tuple[Optional[str], Optional[str]]] = {}
+        # Text variable bound to each value label (see _set_label)
+        self._label_vars: Dict[ctk.CTkLabel, ctk.StringVar] = {}
+        self._progress_value = 0.0
+        # Fields of the last drawn TransferProgress (None after other updates)
+        self._last_progress_key: Optional[tuple] = None
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -20,173 +45,187 @@ class ProgressPanel(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="Progress",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
-        self.title_label.pack(pady=(10, 5), padx=10, anchor="w")
+        self.grid_columnconfigure(0, weight=1)
+        self.title_label.grid(row=0, column=0, pady=(10, 5), padx=10, sticky="w")
 
         # Status label
+        self.status_var = ctk.StringVar(value="Ready")
         self.status_label = ctk.CTkLabel(
             self,
-            text="Ready",
-            font=ctk.CTkFont(size=12),
+            textvariable=self.status_var,
+            font=get_font(12),
             text_color="gray"
         )
-        self.status_label.pack(pady=5, padx=10, anchor="w")
+        self.status_label.grid(row=1, column=0, pady=5, padx=10, sticky="w")
 
         # Progress bar
         self.progress_bar = ctk.CTkProgressBar(self)
-        self.progress_bar.pack(pady=10, padx=10, fill="x")
+        self.progress_bar.grid(row=2, column=0, pady=10, padx=10, sticky="ew")
         self.progress_bar.set(0)
 
-        # Details frame
+        # Details frame: captions in column 0, values in column 1
         details_frame = ctk.CTkFrame(self, fg_color="transparent")
-        details_frame.pack(fill="x", padx=10, pady=5)
+        details_frame.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
+        details_frame.grid_columnconfigure(1, weight=1)
 
         # Files progress
-        files_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
-        files_frame.pack(fill="x", pady=2)
-
         ctk.CTkLabel(
-            files_frame,
+            details_frame,
             text="Files:",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             width=60,
             anchor="w"
-        ).pack(side="left")
+        ).grid(row=0, column=0, sticky="w", pady=2)
 
+        self.files_var = ctk.StringVar(value="0 / 0")
         self.files_label = ctk.CTkLabel(
-            files_frame,
-            text="0 / 0",
-            font=ctk.CTkFont(size=11),
+            details_frame,
+            textvariable=self.files_var,
+            font=get_font(11),
             text_color="gray"
         )
-        self.files_label.pack(side="left")
+        self.files_label.grid(row=0, column=1, sticky="w", pady=2)
 
         # Size progress
-        size_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
-        size_frame.pack(fill="x", pady=2)
-
         ctk.CTkLabel(
-            size_frame,
+            details_frame,
             text="Size:",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             width=60,
             anchor="w"
-        ).pack(side="left")
+        ).grid(row=1, column=0, sticky="w", pady=2)
 
+        self.size_var = ctk.StringVar(value="0 B / 0 B")
         self.size_label = ctk.CTkLabel(
-            size_frame,
-            text="0 B / 0 B",
-            font=ctk.CTkFont(size=11),
+            details_frame,
+            textvariable=self.size_var,
+            font=get_font(11),
             text_color="gray"
         )
-        self.size_label.pack(side="left")
+        self.size_label.grid(row=1, column=1, sticky="w", pady=2)
 
         # Current file
-        current_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
-        current_frame.pack(fill="x", pady=2)
-
         ctk.CTkLabel(
-            current_frame,
+            details_frame,
             text="Current:",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             width=60,
             anchor="w"
-        ).pack(side="left")
+        ).grid(row=2, column=0, sticky="w", pady=2)
 
+        self.current_file_var = ctk.StringVar(value="-")
         self.current_file_label = ctk.CTkLabel(
-            current_frame,
-            text="-",
-            font=ctk.CTkFont(size=11),
+            details_frame,
+            textvariable=self.current_file_var,
+            font=get_font(11),
             text_color="gray"
         )
-        self.current_file_label.pack(side="left", fill="x", expand=True)
+        self.current_file_label.grid(row=2, column=1, sticky="ew", pady=2)
+
+        self._label_vars = {
+            self.status_label: self.status_var,
+            self.files_label: self.files_var,
+            self.size_label: self.size_var,
+            self.current_file_label: self.current_file_var
+        }
 
     def update_progress(self, progress: TransferProgress):
         """Update progress display"""
+        key = (
+            progress.status,
+            progress.completed_files,
+            progress.failed_files,
+            progress.total_files,
+            progress.transferred_size,
+            progress.total_size,
+            progress.current_file
+        )
+        if key == self._last_progress_key:
+            # Nothing visible changed since the last event
+            return
+        self._last_progress_key = key
+
         # Update progress bar
-        progress_value = progress.progress_percent / 100.0
-        self.progress_bar.set(progress_value)
+        self._set_progress(progress.progress_percent / 100.0)
 
-        # Update status
-        status_text = self._get_status_text(progress.status)
-        status_color = self._get_status_color(progress.status)
-        self.status_label.configure(text=status_text, text_color=status_color)
+        # Update status, showing failed files if any
+        status_text = self._STATUS_TEXT.get(progress.status, "Unknown")
+        status_color = self._STATUS_COLOR.get(progress.status, "gray")
+        if progress.failed_files > 0:
+            status_text = f"{status_text} ({progress.failed_files} failed)"
+            status_color = "orange"
+        self._set_label(self.status_label, status_text, status_color)
 
         # Update files
-        self.files_label.configure(
-            text=f"{progress.completed_files} / {progress.total_files}"
-        )
+        self._set_label(self.files_label, f"{progress.completed_files} / {progress.total_files}")
 
         # Update size
-        self.size_label.configure(
-            text=f"{format_size(progress.transferred_size)} / {format_size(progress.total_size)}"
+        self._set_label(
+            self.size_label,
+            f"{progress.transferred_size_str} / {progress.total_size_str}"
         )
 
-        # Update current file
-        if progress.current_file:
+        # Update current file, showing only the name if given a device path
+        filename = progress.current_file.rsplit('/', 1)[-1] if progress.current_file else "-"
+        if len(filename) > 40:
             # Truncate long filenames
-            filename = progress.current_file
-            if len(filename) > 40:
-                filename = filename[:37] + "..."
-            self.current_file_label.configure(text=filename)
-        else:
-            self.current_file_label.configure(text="-")
-
-        # Show failed files if any
-        if progress.failed_files > 0:
-            self.status_label.configure(
-                text=f"{status_text} ({progress.failed_files} failed)",
-                text_color="orange"
-            )
+            filename = filename[:37] + "..."
+        self._set_label(self.current_file_label, filename)
 
     def update_analysis_progress(self, status: str, current: int, total: int):
         """Update progress for analysis operation"""
-        self.status_label.configure(text=status, text_color="blue")
+        self._last_progress_key = None
+        self._set_label(self.status_label, status, "blue")
 
         if total > 0:
-            progress_value = current / total
-            self.progress_bar.set(progress_value)
-            self.files_label.configure(text=f"{current} / {total}")
+            self._set_progress(current / total)
+            self._set_label(self.files_label, f"{current} / {total}")
         else:
             # Indeterminate progress
-            self.progress_bar.set(0.5)
-            self.files_label.configure(text=f"{current}")
+            self._set_progress(0.5)
+            self._set_label(self.files_label, f"{current}")
 
-        self.current_file_label.configure(text="-")
-        self.size_label.configure(text="-")
+        self._set_label(self.current_file_label, "-")
+        self._set_label(self.size_label, "-")
 
     def reset(self):
         """Reset progress display"""
-        self.status_label.configure(text="Ready", text_color="gray")
-        self.progress_bar.set(0)
-        self.files_label.configure(text="0 / 0")
-        self.size_label.configure(text="0 B / 0 B")
-        self.current_file_label.configure(text="-")
+        self._last_progress_key = None
+        self._set_label(self.status_label, "Ready", "gray")
+        self._set_progress(0)
+        self._set_label(self.files_label, "0 / 0")
+        self._set_label(self.size_label, "0 B / 0 B")
+        self._set_label(self.current_file_label, "-")
 
     def set_error(self, message: str):
         """Display error message"""
-        self.status_label.configure(text=f"Error: {message}", text_color="red")
-        self.progress_bar.set(0)
-
-    def _get_status_text(self, status: TransferStatus) -> str:
-        """Get display text for transfer status"""
-        status_map = {
-            TransferStatus.PENDING: "Pending",
-            TransferStatus.IN_PROGRESS: "Transferring photos...",
-            TransferStatus.COMPLETED: "Transfer completed",
-            TransferStatus.FAILED: "Transfer failed",
-            TransferStatus.CANCELLED: "Transfer cancelled"
-        }
-        return status_map.get(status, "Unknown")
-
-    def _get_status_color(self, status: TransferStatus) -> str:
-        """Get color for transfer status"""
-        color_map = {
-            TransferStatus.PENDING: "gray",
-            TransferStatus.IN_PROGRESS: "blue",
-            TransferStatus.COMPLETED: "green",
-            TransferStatus.FAILED: "red",
-            TransferStatus.CANCELLED: "orange"
-        }
-        return color_map.get(status, "gray")
+        self._last_progress_key = None
+        self._set_label(self.status_label, f"Error: {message}", "red")
+        self._set_progress(0)
+
+    def _set_label(self, label: ctk.CTkLabel, text: str, text_color: Optional[str] = None):
+        """
+        Update a value label's text and color, skipping whatever did not change
+
+        Text goes through the label's StringVar, which updates the underlying
+        Tk label directly; only color changes need a CTkLabel.configure call.
+        """
+        last_text, last_color = self._label_state.get(label, (None, None))
+        if text != last_text:
+            self._label_vars[label].set(text)
+        if text_color is not None and text_color != last_color:
+            label.configure(text_color=text_color)
+        else:
+            text_color = last_color
+        self._label_state[label] = (text, text_color)
+
+    def _set_progress(self, value: float):
+        """Move the progress bar only if the change is visible"""
+        if value == self._progress_value:
+            return
+        if abs(value - self._progress_value) <= 0.001 and value not in (0.0, 1.0):
+            return
+        self._progress_value = value
+        self.progress_bar.set(value)
@@ -1,8 +1,19 @@
 """Statistics display panel component"""
 import customtkinter as ctk
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from ...core.settings_manager import ExportStats
+from ..fonts import get_font
+
+
+@lru_cache(maxsize=8)
+def _format_export_date(iso_date: str) -> str:
+    """Format a stored ISO export date for display"""
+    try:
+        return datetime.fromisoformat(iso_date).strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return "Unknown"
 
 
 class StatsPanel(ctk.CTkFrame):
@@ -15,67 +26,63 @@ class StatsPanel(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="Export Statistics",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
-        title.pack(pady=(10, 5), padx=10, anchor="w")
+        self.grid_columnconfigure(0, weight=1)
+        title.grid(row=0, column=0, pady=(10, 5), padx=10, sticky="w")
 
         # Stats container
         stats_container = ctk.CTkFrame(self, fg_color="transparent")
-        stats_container.pack(fill="x", padx=10, pady=5)
+        stats_container.grid(row=1, column=0, padx=10, pady=5, sticky="ew")
 
         # Total files
+        self.files_var = ctk.StringVar(value="Total Exported: 0 files")
         self.files_label = ctk.CTkLabel(
             stats_container,
-            text="Total Exported: 0 files",
-            font=ctk.CTkFont(size=12)
+            textvariable=self.files_var,
+            font=get_font(12)
         )
-        self.files_label.pack(anchor="w", pady=2)
+        self.files_label.grid(row=0, column=0, sticky="w", pady=2)
 
         # Total size
+        self.size_var = ctk.StringVar(value="Total Size: 0 GB")
         self.size_label = ctk.CTkLabel(
             stats_container,
-            text="Total Size: 0 GB",
-            font=ctk.CTkFont(size=12)
+            textvariable=self.size_var,
+            font=get_font(12)
         )
-        self.size_label.pack(anchor="w", pady=2)
+        self.size_label.grid(row=1, column=0, sticky="w", pady=2)
 
         # Total exports
+        self.exports_var = ctk.StringVar(value="Export Sessions: 0")
         self.exports_label = ctk.CTkLabel(
             stats_container,
-            text="Export Sessions: 0",
-            font=ctk.CTkFont(size=12)
+            textvariable=self.exports_var,
+            font=get_font(12)
         )
-        self.exports_label.pack(anchor="w", pady=2)
+        self.exports_label.grid(row=2, column=0, sticky="w", pady=2)
 
         # Last export
+        self.last_export_var = ctk.StringVar(value="Last Export: Never")
         self.last_export_label = ctk.CTkLabel(
             stats_container,
-            text="Last Export: Never",
-            font=ctk.CTkFont(size=12)
+            textvariable=self.last_export_var,
+            font=get_font(12)
         )
-        self.last_export_label.pack(anchor="w", pady=2)
+        self.last_export_label.grid(row=3, column=0, sticky="w", pady=2)
 
     def update_stats(self, stats: ExportStats):
         """Update the displayed statistics"""
-        self.files_label.configure(
-            text=f"Total Exported: {stats.total_files_exported:,} files"
-        )
+        self.files_var.set(f"Total Exported: {stats.total_files_exported:,} files")
 
         if stats.size_gb >= 1:
             size_text = f"{stats.size_gb:.2f} GB"
         else:
             size_text = f"{stats.size_mb:.2f} MB"
 
-        self.size_label.configure(text=f"Total Size: {size_text}")
-        self.exports_label.configure(text=f"Export Sessions: {stats.total_exports}")
+        self.size_var.set(f"Total Size: {size_text}")
+        self.exports_var.set(f"Export Sessions: {stats.total_exports}")
 
-        if stats.last_export_date:
-            try:
-                last_date = datetime.fromisoformat(stats.last_export_date)
-                date_str = last_date.strftime("%Y-%m-%d %H:%M")
-            except Exception:
-                date_str = "Unknown"
-        else:
-            date_str = "Never"
+        date_str = _format_export_date(stats.last_export_date) if stats.last_export_date else "Never"
 
-        self.last_export_label.configure(text=f"Last Export: {date_str}")
+        self.last_export_var.set(f"Last Export: {date_str}")
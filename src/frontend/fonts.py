@@ -0,0 +1,15 @@
+"""Shared fonts for the user interface"""
+from functools import lru_cache
+
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Get the shared font for a size and weight
+
+    Widgets with the same size and weight reuse one CTkFont instead of each
+    creating its own Tk font. Must be called after the root window exists.
+    """
+    return ctk.CTkFont(size=size, weight=weight)
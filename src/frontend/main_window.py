@@ -2,14 +2,16 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from pathlib import Path
+import queue
 import threading
 import logging
+from dataclasses import replace
 from typing import Optional, Dict
 
 from ..backend.device_manager import DeviceManager
 from ..backend.photo_analyzer import PhotoAnalyzer
 from ..backend.photo_transfer import PhotoTransferManager
-from ..backend.models import YearStats, TransferProgress
+from ..backend.models import YearStats, TransferProgress, TransferStatus
 from ..core.config import AppConfig
 from ..core.utils import setup_logging, validate_export_path
 from ..core.settings_manager import SettingsManager, FolderOrganization
@@ -17,6 +19,7 @@ from .components.device_selector import DeviceSelector
 from .components.photo_tree import PhotoTreeView
 from .components.progress_panel import ProgressPanel
 from .components.stats_panel import StatsPanel
+from .fonts import get_font
 
 logger = logging.getLogger(__name__)
 
@@ -52,15 +55,23 @@ class MainWindow(ctk.CTk):
         self._export_path: Optional[Path] = None
         self._is_analyzing = False
 
+        # Latest transfer progress waiting to be drawn (see _on_transfer_progress)
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Optional[TransferProgress] = None
+        self._progress_scheduled = False
+        self._toast_after: Optional[str] = None
+
+        # Device operations run one at a time on a single background thread
+        self._device_queue: queue.Queue = queue.Queue()
+        self._refresh_queued = False
+        threading.Thread(target=self._device_worker_loop, daemon=True).start()
+
         # Setup UI
         self._setup_ui()
 
         # Initial device scan
         self._refresh_devices()
 
-        # Start progress monitor
-        self._start_progress_monitor()
-
     def _setup_ui(self):
         """Setup the user interface"""
         # Configure grid
@@ -74,7 +85,7 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text=AppConfig.APP_NAME,
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         title_label.pack(side="left")
 
@@ -105,7 +116,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             export_frame,
             text="Export Folder",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(pady=(10, 5), padx=10, anchor="w")
 
         path_frame = ctk.CTkFrame(export_frame, fg_color="transparent")
@@ -120,24 +131,22 @@ class MainWindow(ctk.CTk):
         saved_path = self.settings_manager.get_export_path()
         self.path_entry.insert(0, saved_path if saved_path else AppConfig.DEFAULT_EXPORT_FOLDER)
 
-        browse_btn = ctk.CTkButton(
+        self.browse_btn = ctk.CTkButton(
             path_frame,
             text="Browse",
             command=self._browse_export_path,
             width=80
         )
-        browse_btn.pack(side="right")
+        self.browse_btn.pack(side="right")
 
         # Folder organization section
         org_label = ctk.CTkLabel(
             export_frame,
             text="Folder Organization",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=get_font(12, "bold")
         )
         org_label.pack(pady=(10, 5), padx=10, anchor="w")
 
-        self.folder_org_var = ctk.StringVar(value=self.settings_manager.get_folder_organization().value)
-
         # Use segmented button for clearer UX
         self.folder_org_segment = ctk.CTkSegmentedButton(
             export_frame,
@@ -162,34 +171,28 @@ class MainWindow(ctk.CTk):
         )
         delete_check.pack(pady=10, padx=10, anchor="w")
 
-        # Progress panel
-        self.progress_panel = ProgressPanel(left_panel)
-        self.progress_panel.pack(fill="x", padx=10, pady=10)
-
-        # Statistics panel
-        self.stats_panel = StatsPanel(left_panel)
-        self.stats_panel.pack(fill="x", padx=10, pady=10)
-        self.stats_panel.update_stats(self.settings_manager.stats)
-
         # Right panel (photo tree)
         right_panel = ctk.CTkFrame(content_frame)
         right_panel.grid(row=0, column=1, sticky="nsew")
 
-        self.photo_tree = PhotoTreeView(
-            right_panel,
-            on_selection_changed=self._on_selection_changed
-        )
-        self.photo_tree.pack(fill="both", expand=True, padx=10, pady=10)
+        # Panels that are not needed until the user acts are built once the
+        # window has been shown (see _setup_deferred_ui)
+        self._left_panel = left_panel
+        self._right_panel = right_panel
+        self.progress_panel: Optional[ProgressPanel] = None
+        self.stats_panel: Optional[StatsPanel] = None
+        self.photo_tree: Optional[PhotoTreeView] = None
+        self.after_idle(self._setup_deferred_ui)
 
         # Action buttons frame
         action_frame = ctk.CTkFrame(self, fg_color="transparent")
-        action_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(10, 20))
+        action_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(10, 0))
 
         self.export_btn = ctk.CTkButton(
             action_frame,
             text="Export Selected Media",
             command=self._start_export,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             height=45,
             state="disabled"
         )
@@ -199,7 +202,7 @@ class MainWindow(ctk.CTk):
             action_frame,
             text="Cancel",
             command=self._cancel_operation,
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             height=45,
             fg_color="gray",
             hover_color="darkgray",
@@ -207,21 +210,62 @@ class MainWindow(ctk.CTk):
         )
         self.cancel_btn.pack(side="right", fill="x", expand=True)
 
+        # Non-modal notice line for completed operations (see _show_toast)
+        self.toast_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=get_font(12)
+        )
+        self.toast_label.grid(row=3, column=0, sticky="ew", padx=20, pady=(5, 10))
+
+    def _setup_deferred_ui(self):
+        """Build the progress, statistics and photo tree panels (safe to call repeatedly)"""
+        if self.photo_tree is not None:
+            return
+
+        # Progress panel
+        self.progress_panel = ProgressPanel(self._left_panel)
+        self.progress_panel.pack(fill="x", padx=10, pady=10)
+
+        # Statistics panel
+        self.stats_panel = StatsPanel(self._left_panel)
+        self.stats_panel.pack(fill="x", padx=10, pady=10)
+        self.stats_panel.update_stats(self.settings_manager.stats)
+
+        self.photo_tree = PhotoTreeView(
+            self._right_panel,
+            on_selection_changed=self._on_selection_changed
+        )
+        self.photo_tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def _device_worker_loop(self):
+        """Run queued device operations (runs on the device worker thread)"""
+        while True:
+            func, args = self._device_queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Device operation failed: {e}")
+
     def _refresh_devices(self):
         """Refresh list of connected devices in background thread"""
-        thread = threading.Thread(target=self._refresh_devices_worker, daemon=True)
-        thread.start()
+        # Repeated clicks while a refresh is still waiting collapse into one
+        if self._refresh_queued:
+            return
+        self._refresh_queued = True
+        self._device_queue.put((self._refresh_devices_worker, ()))
 
     def _refresh_devices_worker(self):
         """Worker thread for device refresh"""
+        self._refresh_queued = False
         try:
             devices = self.device_manager.list_connected_devices()
 
             # Update UI on main thread
-            self.after(0, lambda: self._on_devices_refreshed(devices))
+            self.after_idle(self._on_devices_refreshed, devices)
         except Exception as e:
             logger.error(f"Device refresh failed: {e}")
-            self.after(0, lambda: messagebox.showerror("Error", f"Failed to refresh devices: {e}"))
+            self.after_idle(messagebox.showerror, "Error", f"Failed to refresh devices: {e}")
 
     def _on_devices_refreshed(self, devices):
         """Handle device refresh completion (runs on main thread)"""
@@ -233,8 +277,7 @@ class MainWindow(ctk.CTk):
 
     def _on_device_selected(self, udid: str):
         """Handle device selection in background thread"""
-        thread = threading.Thread(target=self._connect_device_worker, args=(udid,), daemon=True)
-        thread.start()
+        self._device_queue.put((self._connect_device_worker, (udid,)))
 
     def _connect_device_worker(self, udid: str):
         """Worker thread for device connection"""
@@ -244,22 +287,24 @@ class MainWindow(ctk.CTk):
             # Update UI on main thread
             if success:
                 logger.info(f"Connected to device: {udid}")
-                self.after(0, lambda: self.device_selector.status_label.configure(
+                self.after_idle(lambda: self.device_selector.status_label.configure(
                     text="Device connected",
                     text_color="green"
                 ))
             else:
-                self.after(0, lambda: messagebox.showerror("Connection Error", "Failed to connect to device"))
-                self.after(0, lambda: self.device_selector.status_label.configure(
+                self.after_idle(messagebox.showerror, "Connection Error", "Failed to connect to device")
+                self.after_idle(lambda: self.device_selector.status_label.configure(
                     text="Connection failed",
                     text_color="red"
                 ))
         except Exception as e:
             logger.error(f"Device connection failed: {e}")
-            self.after(0, lambda: messagebox.showerror("Error", f"Failed to connect: {e}"))
+            self.after_idle(messagebox.showerror, "Error", f"Failed to connect: {e}")
 
     def _browse_export_path(self):
         """Browse for export folder"""
+        # The dialog runs its own modal loop, so draw any pending changes first
+        self.update_idletasks()
         folder = filedialog.askdirectory(
             title="Select Export Folder",
             initialdir=self.path_entry.get() or str(Path.home())
@@ -277,7 +322,6 @@ class MainWindow(ctk.CTk):
         else:
             org = FolderOrganization.YEAR_ONLY
 
-        self.folder_org_var.set(org.value)
         self.settings_manager.set_folder_organization(org)
         logger.info(f"Folder organization changed to: {org.value}")
 
@@ -297,6 +341,9 @@ class MainWindow(ctk.CTk):
             messagebox.showerror("Error", "No device connected")
             return
 
+        # Every later UI update starts from here, so make sure all panels exist
+        self._setup_deferred_ui()
+
         self._is_analyzing = True
         self._set_ui_state(analyzing=True)
         self.progress_panel.reset()
@@ -309,17 +356,27 @@ class MainWindow(ctk.CTk):
     def _analyze_photos(self):
         """Analyze photos (runs in background thread)"""
         try:
+            last_forwarded = 0
+
             def progress_callback(status: str, current: int, total: int):
-                self.after(0, lambda: self.progress_panel.update_analysis_progress(status, current, total))
+                # Forward only once the count has moved by 1% of the total (at most
+                # 200 items), plus the start of each phase, so a fast scan cannot
+                # flood the Tk event queue
+                nonlocal last_forwarded
+                step = min(200, max(1, total // 100))
+                if current != 0 and last_forwarded <= current < last_forwarded + step:
+                    return
+                last_forwarded = current
+                self.after_idle(self.progress_panel.update_analysis_progress, status, current, total)
 
             self._year_stats = self.photo_analyzer.analyze_photos(progress_callback)
 
             # Update UI on main thread
-            self.after(0, self._on_analysis_complete)
+            self.after_idle(self._on_analysis_complete)
 
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
-            self.after(0, lambda: self._on_analysis_error(str(e)))
+            self.after_idle(self._on_analysis_error, str(e))
 
     def _on_analysis_complete(self):
         """Handle analysis completion"""
@@ -331,9 +388,9 @@ class MainWindow(ctk.CTk):
         self.progress_panel.reset()
 
         total_photos = sum(ys.photo_count for ys in self._year_stats.values())
-        messagebox.showinfo(
-            "Analysis Complete",
-            f"Found {total_photos} media files (photos & videos) across {len(self._year_stats)} years"
+        self._show_toast(
+            f"Analysis complete: found {total_photos} media files (photos & videos) "
+            f"across {len(self._year_stats)} years"
         )
 
     def _on_analysis_error(self, error_msg: str):
@@ -364,9 +421,11 @@ class MainWindow(ctk.CTk):
 
         self._export_path = Path(export_path_str)
 
-        # Get selected photos
-        selected_photos = self.photo_analyzer.get_selected_photos(self._year_stats)
-        if not selected_photos:
+        # Snapshot the selected months. Their Photo objects are only built on
+        # the transfer thread, so large selections don't stall the UI here.
+        selected_months = self.photo_analyzer.get_selected_months(self._year_stats)
+        selected_count = sum(month_stat.photo_count for month_stat in selected_months)
+        if not selected_count:
             messagebox.showwarning("No Selection", "Please select media files to export")
             return
 
@@ -374,7 +433,7 @@ class MainWindow(ctk.CTk):
         delete_text = " and delete from device" if self.delete_var.get() else ""
         confirm = messagebox.askyesno(
             "Confirm Export",
-            f"Export {len(selected_photos)} media files to:\n{self._export_path}\n{delete_text}?"
+            f"Export {selected_count} media files to:\n{self._export_path}\n{delete_text}?"
         )
 
         if not confirm:
@@ -388,21 +447,46 @@ class MainWindow(ctk.CTk):
         batch_size = self.settings_manager.get_batch_size()
 
         self.transfer_manager.start_transfer(
-            photos=selected_photos,
+            photos=(photo for month_stat in selected_months for photo in month_stat.photos),
             export_path=self._export_path,
             delete_after_transfer=self.delete_var.get(),
             progress_callback=self._on_transfer_progress,
             folder_organization=folder_org,
-            batch_size=batch_size
+            batch_size=batch_size,
+            total_size=sum(month_stat.total_size for month_stat in selected_months)
         )
 
     def _on_transfer_progress(self, progress: TransferProgress):
-        """Handle transfer progress update"""
-        self.after(0, lambda: self.progress_panel.update_progress(progress))
+        """
+        Handle transfer progress update (runs on the transfer thread)
+
+        Updates are coalesced so the UI redraws at most once per
+        AppConfig.PROGRESS_REDRAW_MS; only the latest progress is drawn.
+        """
+        # The backend keeps updating the same object, so hand the UI a snapshot
+        snapshot = replace(progress)
+        with self._progress_lock:
+            self._pending_progress = snapshot
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+
+        self.after(AppConfig.PROGRESS_REDRAW_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        """Draw the latest pending transfer progress"""
+        with self._progress_lock:
+            progress, self._pending_progress = self._pending_progress, None
+            self._progress_scheduled = False
+
+        if progress is None:
+            return
+
+        self.progress_panel.update_progress(progress)
 
         # Handle completion
-        if progress.status.value in ["completed", "failed", "cancelled"]:
-            self.after(0, lambda: self._on_transfer_complete(progress))
+        if progress.status in (TransferStatus.COMPLETED, TransferStatus.FAILED, TransferStatus.CANCELLED):
+            self._on_transfer_complete(progress)
 
     def _on_transfer_complete(self, progress: TransferProgress):
         """Handle transfer completion"""
@@ -417,10 +501,10 @@ class MainWindow(ctk.CTk):
                 )
                 self.stats_panel.update_stats(self.settings_manager.stats)
 
-            messagebox.showinfo(
-                "Export Complete",
-                f"Successfully exported {progress.completed_files} media files\n"
-                f"Failed: {progress.failed_files}"
+            self._show_toast(
+                f"Export complete: {progress.completed_files} media files exported, "
+                f"{progress.failed_files} failed",
+                "green" if progress.failed_files == 0 else "orange"
             )
             # Refresh analysis after successful export
             if self.delete_var.get():
@@ -431,7 +515,20 @@ class MainWindow(ctk.CTk):
                 f"Transfer failed: {progress.error_message}"
             )
         elif progress.status.value == "cancelled":
-            messagebox.showinfo("Cancelled", "Transfer was cancelled")
+            self._show_toast("Transfer was cancelled", "orange")
+
+    def _show_toast(self, message: str, text_color: str = "green"):
+        """Show a notice below the action buttons that clears itself after a few seconds"""
+        if self._toast_after is not None:
+            self.after_cancel(self._toast_after)
+
+        self.toast_label.configure(text=message, text_color=text_color)
+        self._toast_after = self.after(AppConfig.TOAST_DURATION_MS, self._clear_toast)
+
+    def _clear_toast(self):
+        """Hide the current notice"""
+        self._toast_after = None
+        self.toast_label.configure(text="")
 
     def _cancel_operation(self):
         """Cancel ongoing operation"""
@@ -450,19 +547,11 @@ class MainWindow(ctk.CTk):
         self.device_selector.set_enabled(not is_busy)
         self.device_selector.set_analyze_enabled(not is_busy)
         self.export_btn.configure(state="disabled" if is_busy else "normal")
+        # Browsing is blocked during transfer so its modal dialog can't stall progress updates
+        self.browse_btn.configure(state="disabled" if transferring else "normal")
         self.cancel_btn.configure(state="normal" if transferring else "disabled")
         self.photo_tree.set_enabled(not is_busy)
 
-    def _start_progress_monitor(self):
-        """Monitor transfer progress"""
-        if self.transfer_manager.is_transfer_active():
-            progress = self.transfer_manager.get_current_progress()
-            if progress:
-                self.progress_panel.update_progress(progress)
-
-        # Schedule next check
-        self.after(500, self._start_progress_monitor)
-
     def on_closing(self):
         """Handle window closing"""
         if self.transfer_manager.is_transfer_active():
@@ -473,6 +562,7 @@ class MainWindow(ctk.CTk):
             if not confirm:
                 return
 
+        self.settings_manager.flush()
         self.device_manager.disconnect_device()
         self.destroy()
 